@@ -0,0 +1,62 @@
+import asyncio
+import logging
+from typing import Optional
+
+from app.config import get_settings
+from app.supabase_client import get_supabase
+
+logger = logging.getLogger(__name__)
+
+
+def archive_batch() -> int:
+    """Move one batch of old HIRED/REJECTED applicants to the archive. Returns the number moved."""
+    settings = get_settings()
+    supabase = get_supabase()
+
+    result = supabase.rpc("archive_applicants", {
+        "batch_size": settings.archive_batch_size,
+        "default_days": settings.archive_after_days,
+    }).execute()
+    return result.data or 0
+
+
+def run_archival() -> int:
+    """Archive in batches until nothing is left to move. Returns the total moved."""
+    settings = get_settings()
+    total = 0
+    while True:
+        moved = archive_batch()
+        total += moved
+        if moved < settings.archive_batch_size:
+            return total
+
+
+class ArchiveWorker:
+    """In-process task that runs archival every archive_interval seconds until stopped."""
+
+    def __init__(self):
+        self._task: Optional[asyncio.Task] = None
+        self._stopping = asyncio.Event()
+
+    async def run(self) -> None:
+        settings = get_settings()
+        while not self._stopping.is_set():
+            try:
+                moved = await asyncio.to_thread(run_archival)
+                if moved:
+                    logger.info("Archived %s applicants", moved)
+            except Exception:
+                logger.exception("Applicant archival failed")
+
+            try:
+                await asyncio.wait_for(self._stopping.wait(), timeout=settings.archive_interval)
+            except asyncio.TimeoutError:
+                pass
+
+    def start(self) -> None:
+        self._task = asyncio.create_task(self.run())
+
+    async def stop(self) -> None:
+        self._stopping.set()
+        if self._task:
+            await self._task
@@ -29,18 +29,23 @@ def verify_token(credentials: HTTPAuthorizationCredentials = Depends(security))
 
 
 def get_current_user(payload: dict = Depends(verify_token)) -> dict:
-    """Extract user info from JWT and fetch shop_id from profile."""
+    """
+    Extract user info from the verified JWT.
+
+    shop_id and full_name are custom claims added by custom_access_token_hook.
+    Tokens issued before the user had a shop don't carry shop_id, so only then
+    is the profile looked up.
+    """
     user_id = payload.get("sub")
+    shop_id = payload.get("shop_id")
+    full_name = payload.get("full_name")
     
-    # Fetch profile to get shop_id
-    supabase = get_supabase()
-    profile = supabase.table("profiles").select("shop_id, full_name").eq("id", user_id).execute()
-    
-    shop_id = None
-    full_name = None
-    if profile.data:
-        shop_id = profile.data[0].get("shop_id")
-        full_name = profile.data[0].get("full_name")
+    if not shop_id:
+        supabase = get_supabase()
+        profile = supabase.table("profiles").select("shop_id, full_name").eq("id", user_id).execute()
+        if profile.data:
+            shop_id = profile.data[0].get("shop_id")
+            full_name = profile.data[0].get("full_name")
     
     return {
         "user_id": user_id,
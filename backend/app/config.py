@@ -15,6 +15,28 @@ class Settings(BaseSettings):
     # Database URL (optional - not needed when using Supabase client)
     database_url: Optional[str] = None
 
+    # Form schema (optional - defaults to the bundled app/form_schema.json)
+    form_schema_path: Optional[str] = None
+
+    # Outbox worker (side effects drained in the background)
+    outbox_enabled: bool = True
+    outbox_batch_size: int = 50
+    outbox_poll_interval: float = 1.0
+    outbox_max_attempts: int = 8
+    outbox_backoff_base: float = 2.0
+    outbox_backoff_max: float = 600.0
+    outbox_retention_days: int = 7
+    outbox_purge_interval: float = 3600.0
+
+    # Archival of old HIRED/REJECTED applicants (per-shop override: settings.archive_after_days)
+    archive_enabled: bool = True
+    archive_after_days: int = 90
+    archive_batch_size: int = 200
+    archive_interval: float = 3600.0
+
+    # Response compression (br when the brotli package is installed, else gzip)
+    compression_minimum_size: int = 1024
+
     class Config:
         env_file = ".env"
         env_file_encoding = "utf-8"
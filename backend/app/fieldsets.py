@@ -0,0 +1,18 @@
+from typing import Sequence
+
+from fastapi import HTTPException
+
+
+def select_columns(fields: str, allowed: Sequence[str]) -> str:
+    """
+    Turn a `fields=` query value (comma-separated) into a PostgREST select list.
+
+    `id` is always included so rows stay addressable.
+    """
+    requested = [name.strip() for name in fields.split(",") if name.strip()]
+    unknown = [name for name in requested if name not in allowed]
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown fields: {', '.join(unknown)}")
+
+    columns = ["id"] + [name for name in dict.fromkeys(requested) if name != "id"]
+    return ", ".join(columns)
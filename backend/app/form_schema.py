@@ -0,0 +1,55 @@
+import json
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, List
+
+from app.config import get_settings
+
+DEFAULT_SCHEMA_PATH = Path(__file__).with_name("form_schema.json")
+
+# Keys the public apply form stores that map onto a schema field
+FIELD_ALIASES = {
+    "experience_years": "years_in_industry",
+    "certifications": "ase_certs",
+}
+
+# Schema fields stored as top-level applicant columns rather than in form_data
+CORE_FIELDS = ("full_name", "email", "phone", "position_applied", "source")
+
+# Field types that can be used as equality filters on the list endpoint
+FILTERABLE_TYPES = ("select",)
+
+
+@lru_cache()
+def get_form_schema() -> Dict[str, Any]:
+    """Load the sections/fields form schema once per process."""
+    settings = get_settings()
+    path = Path(settings.form_schema_path) if settings.form_schema_path else DEFAULT_SCHEMA_PATH
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def iter_fields(schema: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Flatten a form schema into its list of field definitions."""
+    return [field for section in schema.get("sections", []) for field in section.get("fields", [])]
+
+
+@lru_cache()
+def get_filterable_fields() -> Dict[str, List[str]]:
+    """Map of form_data select keys (visible on the application) to their options."""
+    return {
+        field["key"]: field["options"]
+        for field in iter_fields(get_form_schema())
+        if field["type"] in FILTERABLE_TYPES
+        and field.get("visibility") != "internal"
+        and field["key"] not in CORE_FIELDS
+        and field.get("options")
+    }
+
+
+@lru_cache()
+def get_cert_codes() -> Dict[str, str]:
+    """Map of ASE cert codes (e.g. "A8") to the full option stored in form_data."""
+    fields = {field["key"]: field for field in iter_fields(get_form_schema())}
+    options = fields.get("ase_certs", {}).get("options", [])
+    return {option.split(" ", 1)[0].upper(): option for option in options}
@@ -0,0 +1,160 @@
+import logging
+from datetime import date, datetime
+from functools import lru_cache
+from typing import Annotated, Any, Dict, List, Literal, Optional, Tuple, Type
+
+from pydantic import BaseModel, ConfigDict, Field, ValidationError, create_model, model_validator
+
+from app.form_schema import CORE_FIELDS, FIELD_ALIASES, get_form_schema, iter_fields
+
+# Limits that bound the size of a stored form_data payload
+MAX_FORM_KEYS = 100
+MAX_TEXT_LENGTH = 500
+MAX_TEXTAREA_LENGTH = 5000
+MAX_URL_LENGTH = 2048
+MAX_FILES = 10
+MAX_EXTRA_LENGTH = 2000
+
+logger = logging.getLogger(__name__)
+
+ROLES = ("applicant", "admin")
+
+# (shop_id, role) -> (shops.updated_at, compiled model) for shops with their own
+# schema in shops.settings["form_schema"]; one entry per shop and role, replaced
+# when the shop is updated
+_shop_models: Dict[Tuple[str, str], Tuple[str, Type[BaseModel]]] = {}
+
+
+class FormDataError(ValueError):
+    """form_data failed validation against the form schema."""
+
+    def __init__(self, errors: List[Dict[str, Any]]):
+        super().__init__("Invalid form_data")
+        self.errors = errors
+
+
+def _field_type(field: Dict[str, Any]) -> Any:
+    """Python type for a schema field definition."""
+    field_type = field["type"]
+    options = field.get("options")
+
+    if field_type == "select" and options:
+        return Literal[tuple(options)]
+    if field_type == "multi_select" and options:
+        return Annotated[List[Literal[tuple(options)]], Field(max_length=len(options))]
+    if field_type == "number":
+        return Annotated[int, Field(ge=0, le=100)]
+    if field_type == "rating_1_10":
+        return Annotated[int, Field(ge=1, le=10)]
+    if field_type == "date":
+        return date
+    if field_type == "datetime":
+        return datetime
+    if field_type == "file":
+        return Annotated[str, Field(max_length=MAX_URL_LENGTH)]
+    if field_type == "file_multi":
+        return Annotated[List[Annotated[str, Field(max_length=MAX_URL_LENGTH)]], Field(max_length=MAX_FILES)]
+    if field_type == "textarea":
+        return Annotated[str, Field(max_length=MAX_TEXTAREA_LENGTH)]
+    return Annotated[str, Field(max_length=MAX_TEXT_LENGTH)]
+
+
+def compile_form_model(schema: Dict[str, Any], role: str) -> Type[BaseModel]:
+    """
+    Compile a form schema into a Pydantic model for one editor role.
+
+    Fields the role may edit are typed from the schema. Schema fields the role
+    may not edit are rejected. Keys outside the schema are kept but must be
+    short scalars.
+    """
+    fields: Dict[str, Any] = {}
+    types: Dict[str, Any] = {}
+    restricted = set()
+
+    for field in iter_fields(schema):
+        key = field["key"]
+        if key in CORE_FIELDS:
+            continue
+        types[key] = _field_type(field)
+        if role in field.get("editable_by", []):
+            fields[key] = (Optional[types[key]], None)
+        else:
+            restricted.add(key)
+
+    for alias, key in FIELD_ALIASES.items():
+        if key in fields:
+            fields[alias] = (Optional[types[key]], None)
+
+    restricted = frozenset(restricted)
+
+    def check_extra(self):
+        for key, value in (self.__pydantic_extra__ or {}).items():
+            if key in restricted:
+                raise ValueError(f"{key} is not editable by {role}")
+            if value is not None and not isinstance(value, (str, bool, int, float)):
+                raise ValueError(f"{key} must be a text, number or yes/no value")
+            if isinstance(value, str) and len(value) > MAX_EXTRA_LENGTH:
+                raise ValueError(f"{key} is too long")
+        return self
+
+    return create_model(
+        f"FormData_{role}",
+        __config__=ConfigDict(extra="allow", str_strip_whitespace=True),
+        __validators__={"check_extra": model_validator(mode="after")(check_extra)},
+        **fields,
+    )
+
+
+@lru_cache()
+def get_default_form_model(role: str) -> Type[BaseModel]:
+    """Compiled model for the default form schema."""
+    return compile_form_model(get_form_schema(), role)
+
+
+def get_form_model(shop: Dict[str, Any], role: str) -> Type[BaseModel]:
+    """
+    Compiled model for a shop, honouring a per-shop schema in its settings.
+
+    Falls back to the default schema when the shop's schema doesn't compile.
+    """
+    schema = (shop.get("settings") or {}).get("form_schema")
+    if not schema:
+        return get_default_form_model(role)
+
+    key = (str(shop["id"]), role)
+    updated_at = str(shop.get("updated_at"))
+    cached = _shop_models.get(key)
+    if cached and cached[0] == updated_at:
+        return cached[1]
+
+    # Shop users can edit settings directly, so a broken schema must not break submissions
+    try:
+        model = compile_form_model(schema, role)
+    except Exception:
+        logger.warning("Invalid form_schema for shop %s, using the default schema", shop["id"], exc_info=True)
+        model = get_default_form_model(role)
+
+    _shop_models[key] = (updated_at, model)
+    return model
+
+
+def warm_form_models() -> None:
+    """Load the default schema and compile its models (called at startup)."""
+    for role in ROLES:
+        get_default_form_model(role)
+
+
+def validate_form_data(form_data: Dict[str, Any], shop: Dict[str, Any], role: str) -> Dict[str, Any]:
+    """Validate form_data for a shop and role, returning the cleaned JSON-safe dict."""
+    if len(form_data) > MAX_FORM_KEYS:
+        raise FormDataError([{"loc": ["form_data"], "msg": f"At most {MAX_FORM_KEYS} fields allowed"}])
+
+    model = get_form_model(shop, role)
+    try:
+        validated = model.model_validate(form_data)
+    except ValidationError as e:
+        raise FormDataError([
+            {"loc": ["form_data", *error["loc"]], "msg": error["msg"]} for error in e.errors()
+        ])
+
+    return validated.model_dump(mode="json", exclude_unset=True)
@@ -1,14 +1,38 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from app.config import get_settings
-from app.routers import applicants_router, notes_router, upload_router, shops_router, constants_router
+from app.form_validation import warm_form_models
+from app.outbox import OutboxWorker
+from app.archive import ArchiveWorker
+from app.compression import CompressionMiddleware
+from app.routers import applicants_router, notes_router, notes_search_router, upload_router, shops_router, constants_router
 
 settings = get_settings()
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Load and compile the form schema once, before the first submission
+    warm_form_models()
+
+    outbox_worker = OutboxWorker()
+    if settings.outbox_enabled:
+        outbox_worker.start()
+
+    archive_worker = ArchiveWorker()
+    if settings.archive_enabled:
+        archive_worker.start()
+    yield
+    await archive_worker.stop()
+    await outbox_worker.stop()
+
+
 app = FastAPI(
     title="AutoShopATS API",
     description="Applicant Tracking System for Automotive Shops",
-    version="2.0.0"
+    version="2.0.0",
+    lifespan=lifespan
 )
 
 # CORS configuration
@@ -21,9 +45,13 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress JSON responses for clients on slow connections
+app.add_middleware(CompressionMiddleware, minimum_size=settings.compression_minimum_size)
+
 # Include routers
 app.include_router(applicants_router)
 app.include_router(notes_router)
+app.include_router(notes_search_router)
 app.include_router(upload_router)
 app.include_router(shops_router)
 app.include_router(constants_router)
@@ -0,0 +1,178 @@
+import asyncio
+import logging
+import random
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, List, Optional
+
+from postgrest.exceptions import APIError
+
+from app.config import get_settings
+from app.supabase_client import get_supabase
+
+logger = logging.getLogger(__name__)
+
+EventHandler = Callable[[Dict[str, Any]], None]
+
+# event_type -> handler; events are written by triggers in 004_outbox.sql
+HANDLERS: Dict[str, EventHandler] = {}
+
+# Postgres foreign_key_violation
+FOREIGN_KEY_VIOLATION = "23503"
+APPLICANT_FKEY = "applicant_notes_applicant_id_fkey"
+ADDED_BY_FKEY = "applicant_notes_added_by_id_fkey"
+
+
+def handles(event_type: str) -> Callable[[EventHandler], EventHandler]:
+    """Register a handler for an outbox event type."""
+    def decorator(func: EventHandler) -> EventHandler:
+        HANDLERS[event_type] = func
+        return func
+    return decorator
+
+
+def _add_system_note(event: Dict[str, Any], message: str, added_by: str, added_by_id: Optional[str] = None) -> None:
+    """
+    Insert a note for the event's applicant, at most once per event.
+
+    An applicant deleted or archived before the event ran needs no note; an
+    actor whose profile was deleted is kept by name only.
+    """
+    supabase = get_supabase()
+    try:
+        supabase.table("applicant_notes").upsert({
+            "applicant_id": event["payload"]["applicant_id"],
+            "added_by": added_by,
+            "added_by_id": added_by_id,
+            "message": message,
+            "source_event_id": event["id"],
+        }, on_conflict="source_event_id", ignore_duplicates=True).execute()
+    except APIError as e:
+        if e.code != FOREIGN_KEY_VIOLATION:
+            raise
+        violated = f"{e.message} {e.details}"
+        if APPLICANT_FKEY in violated:
+            logger.info("Skipping note for outbox event %s: applicant %s no longer active",
+                        event["id"], event["payload"]["applicant_id"])
+        elif ADDED_BY_FKEY in violated and added_by_id is not None:
+            _add_system_note(event, message, added_by, None)
+        else:
+            raise
+
+
+@handles("applicant.created")
+def applicant_created(event: Dict[str, Any]) -> None:
+    payload = event["payload"]
+    _add_system_note(event, f"Application submitted via {payload.get('source') or 'website'}.", "System")
+
+
+@handles("applicant.status_changed")
+def applicant_status_changed(event: Dict[str, Any]) -> None:
+    payload = event["payload"]
+    _add_system_note(
+        event,
+        f"Status changed from {payload['old_status']} to {payload['new_status']}.",
+        payload.get("changed_by") or "Unknown",
+        payload.get("changed_by_id"),
+    )
+
+
+def backoff_delay(attempts: int) -> float:
+    """Seconds to wait before retrying an event that has failed `attempts` times."""
+    settings = get_settings()
+    delay = min(settings.outbox_backoff_base * 2 ** (attempts - 1), settings.outbox_backoff_max)
+    return delay * random.uniform(0.8, 1.2)
+
+
+def process_batch() -> int:
+    """Claim and handle one batch of due events. Returns the number claimed."""
+    settings = get_settings()
+    supabase = get_supabase()
+
+    claimed = supabase.rpc("claim_outbox_events", {"batch_size": settings.outbox_batch_size}).execute()
+    events: List[Dict[str, Any]] = claimed.data or []
+
+    done = []
+    for event in events:
+        handler = HANDLERS.get(event["event_type"])
+        try:
+            if handler is None:
+                raise LookupError(f"No handler for {event['event_type']}")
+            handler(event)
+            done.append(event["id"])
+        except Exception as e:
+            _record_failure(event, e)
+
+    if done:
+        supabase.table("outbox_events").update({
+            "processed_at": datetime.now(timezone.utc).isoformat(),
+            "locked_until": None,
+        }).in_("id", done).execute()
+
+    return len(events)
+
+
+def purge_processed() -> None:
+    """Delete processed events older than outbox_retention_days. Parked failures are kept."""
+    settings = get_settings()
+    cutoff = datetime.now(timezone.utc) - timedelta(days=settings.outbox_retention_days)
+    get_supabase().table("outbox_events").delete()\
+        .lt("processed_at", cutoff.isoformat())\
+        .execute()
+
+
+def _record_failure(event: Dict[str, Any], error: Exception) -> None:
+    """Schedule a retry with backoff, or park the event after too many attempts."""
+    settings = get_settings()
+    now = datetime.now(timezone.utc)
+    attempts = event["attempts"]
+
+    update = {"last_error": str(error)[:1000], "locked_until": None}
+    if attempts >= settings.outbox_max_attempts:
+        update["failed_at"] = now.isoformat()
+        logger.error("Outbox event %s (%s) failed permanently: %s", event["id"], event["event_type"], error)
+    else:
+        update["available_at"] = (now + timedelta(seconds=backoff_delay(attempts))).isoformat()
+        logger.warning("Outbox event %s (%s) failed, attempt %s: %s", event["id"], event["event_type"], attempts, error)
+
+    get_supabase().table("outbox_events").update(update).eq("id", event["id"]).execute()
+
+
+class OutboxWorker:
+    """In-process task that drains the outbox until stopped."""
+
+    def __init__(self):
+        self._task: Optional[asyncio.Task] = None
+        self._stopping = asyncio.Event()
+
+    async def run(self) -> None:
+        settings = get_settings()
+        loop = asyncio.get_running_loop()
+        next_purge = loop.time()
+        while not self._stopping.is_set():
+            try:
+                claimed = await asyncio.to_thread(process_batch)
+            except Exception:
+                logger.exception("Outbox batch failed")
+                claimed = 0
+
+            if loop.time() >= next_purge:
+                try:
+                    await asyncio.to_thread(purge_processed)
+                except Exception:
+                    logger.exception("Outbox purge failed")
+                next_purge = loop.time() + settings.outbox_purge_interval
+
+            # Keep draining while batches come back full, otherwise poll
+            if claimed < settings.outbox_batch_size:
+                try:
+                    await asyncio.wait_for(self._stopping.wait(), timeout=settings.outbox_poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+
+    def start(self) -> None:
+        self._task = asyncio.create_task(self.run())
+
+    async def stop(self) -> None:
+        self._stopping.set()
+        if self._task:
+            await self._task
@@ -1,12 +1,15 @@
-from fastapi import APIRouter, HTTPException, Query, status, Depends
+from fastapi import APIRouter, HTTPException, Query, Request, status, Depends
 from typing import List, Optional
 from uuid import UUID
 
 from app.supabase_client import get_supabase
 from app.auth import get_current_user
+from app.form_schema import get_filterable_fields, get_cert_codes
+from app.form_validation import validate_form_data, FormDataError
+from app.fieldsets import select_columns
 from app.schemas.applicant import (
     ApplicantCreate, ApplicantUpdate, ApplicantResponse,
-    ApplicantListResponse, VALID_STATUSES, VALID_POSITIONS
+    ApplicantPartialResponse, VALID_STATUSES, VALID_POSITIONS, APPLICANT_LIST_FIELDS
 )
 
 router = APIRouter(prefix="/api/applicants", tags=["applicants"])
@@ -18,10 +21,15 @@ def create_applicant(applicant: ApplicantCreate):
     supabase = get_supabase()
     
     # Verify shop exists
-    shop = supabase.table("shops").select("id").eq("id", str(applicant.shop_id)).execute()
+    shop = supabase.table("shops").select("id, updated_at, settings").eq("id", str(applicant.shop_id)).execute()
     if not shop.data:
         raise HTTPException(status_code=404, detail="Shop not found")
     
+    try:
+        form_data = validate_form_data(applicant.form_data or {}, shop.data[0], "applicant")
+    except FormDataError as e:
+        raise HTTPException(status_code=422, detail=e.errors)
+    
     data = {
         "shop_id": str(applicant.shop_id),
         "full_name": applicant.full_name,
@@ -29,44 +37,57 @@ def create_applicant(applicant: ApplicantCreate):
         "phone": applicant.phone,
         "position_applied": applicant.position_applied,
         "source": applicant.source,
-        "form_data": applicant.form_data or {},
+        "form_data": form_data,
         "internal_data": {},
         "status": "NEW"
     }
     
+    # The initial system note is added by the outbox worker (applicant.created)
     result = supabase.table("applicants").insert(data).execute()
     if not result.data:
         raise HTTPException(status_code=500, detail="Failed to create applicant")
     
-    new_applicant = result.data[0]
-    
-    # Create initial note
-    supabase.table("applicant_notes").insert({
-        "applicant_id": new_applicant["id"],
-        "added_by": "System",
-        "message": f"Application submitted via {applicant.source or 'website'}."
-    }).execute()
-    
-    return new_applicant
+    return result.data[0]
 
 
-@router.get("", response_model=List[ApplicantListResponse])
+@router.get("", response_model=List[ApplicantPartialResponse], response_model_exclude_unset=True)
 def list_applicants(
+    request: Request,
     status: Optional[str] = Query(None),
     position: Optional[str] = Query(None),
     search: Optional[str] = Query(None),
+    cert: Optional[List[str]] = Query(None),
+    min_experience: Optional[int] = Query(None, ge=0),
+    include_archived: bool = Query(False),
+    fields: Optional[str] = Query(None, description="Comma-separated columns to return, e.g. id,full_name,status"),
     current_user: dict = Depends(get_current_user)
 ):
-    """List applicants for current user's shop"""
+    """
+    List applicants for current user's shop.
+
+    Besides status/position/search, filters on form_data fields:
+    - cert: ASE cert code (e.g. A8), repeatable; applicant must hold all of them
+    - min_experience: minimum years in the automotive industry
+    - any application select field from the form schema, e.g. skill_engine_performance=Advanced
+
+    Archived (old HIRED/REJECTED) applicants are only included with include_archived=true.
+    fields= narrows the selected columns at the database; only those are returned.
+    """
     supabase = get_supabase()
     shop_id = current_user.get("shop_id")
     
     if not shop_id:
         raise HTTPException(status_code=400, detail="User not associated with a shop")
     
-    query = supabase.table("applicants").select(
-        "id, created_at, full_name, email, phone, position_applied, status, source"
-    ).eq("shop_id", shop_id)
+    if fields:
+        columns = select_columns(fields, APPLICANT_LIST_FIELDS)
+    else:
+        columns = "id, created_at, full_name, email, phone, position_applied, status, source"
+    if include_archived:
+        query = supabase.table("applicants_all").select(columns + ", archived")
+    else:
+        query = supabase.table("applicants").select(columns)
+    query = query.eq("shop_id", shop_id)
     
     if status:
         if status not in VALID_STATUSES:
@@ -79,17 +100,48 @@ def list_applicants(
     if search:
         query = query.or_(f"full_name.ilike.%{search}%,email.ilike.%{search}%,phone.ilike.%{search}%")
     
+    # Generated, indexed columns for the hot keys
+    if cert:
+        cert_codes = get_cert_codes()
+        certs = []
+        for code in cert:
+            if code.upper() not in cert_codes:
+                raise HTTPException(status_code=400, detail=f"Invalid cert: {code}")
+            certs.append(cert_codes[code.upper()])
+        query = query.contains("ase_certs", "{" + ",".join(f'"{c}"' for c in certs) + "}")
+    
+    if min_experience is not None:
+        query = query.gte("experience_years", min_experience)
+    
+    # Remaining select fields go through one form_data containment (GIN jsonb_path_ops)
+    filterable = get_filterable_fields()
+    form_filters = {}
+    for key, value in request.query_params.items():
+        if key not in filterable:
+            continue
+        if value not in filterable[key]:
+            raise HTTPException(status_code=400, detail=f"Invalid value for {key}")
+        form_filters[key] = value
+    
+    if form_filters:
+        query = query.contains("form_data", form_filters)
+    
     result = query.order("created_at", desc=True).execute()
     return result.data
 
 
 @router.get("/{applicant_id}", response_model=ApplicantResponse)
-def get_applicant(applicant_id: UUID, current_user: dict = Depends(get_current_user)):
+def get_applicant(
+    applicant_id: UUID,
+    include_archived: bool = Query(False),
+    current_user: dict = Depends(get_current_user)
+):
     """Get single applicant detail"""
     supabase = get_supabase()
     shop_id = current_user.get("shop_id")
     
-    result = supabase.table("applicants").select("*")\
+    table = "applicants_all" if include_archived else "applicants"
+    result = supabase.table(table).select("*")\
         .eq("id", str(applicant_id))\
         .eq("shop_id", shop_id)\
         .execute()
@@ -119,11 +171,21 @@ def update_applicant(
     if not current.data:
         raise HTTPException(status_code=404, detail="Applicant not found")
     
-    old_status = current.data[0]["status"]
     update_data = updates.model_dump(exclude_unset=True)
     
+    # Recorded for the status-change note written by the outbox worker
+    if "status" in update_data:
+        update_data["status_changed_by"] = current_user.get("email", "Unknown")
+        update_data["status_changed_by_id"] = current_user.get("user_id")
+    
     # Handle JSONB merge for form_data and internal_data
     if "form_data" in update_data and update_data["form_data"]:
+        shop = supabase.table("shops").select("id, updated_at, settings").eq("id", shop_id).execute()
+        try:
+            update_data["form_data"] = validate_form_data(update_data["form_data"], shop.data[0], "admin")
+        except FormDataError as e:
+            raise HTTPException(status_code=422, detail=e.errors)
+        
         existing_form = current.data[0].get("form_data", {})
         existing_form.update(update_data["form_data"])
         update_data["form_data"] = existing_form
@@ -138,14 +200,27 @@ def update_applicant(
         .eq("shop_id", shop_id)\
         .execute()
     
-    # Auto-note if status changed
-    if "status" in update_data and update_data["status"] != old_status:
-        supabase.table("applicant_notes").insert({
-            "applicant_id": str(applicant_id),
-            "added_by": current_user.get("email", "Unknown"),
-            "added_by_id": current_user.get("user_id"),
-            "message": f"Status changed from {old_status} to {update_data['status']}."
-        }).execute()
+    return result.data[0]
+
+
+@router.post("/{applicant_id}/restore", response_model=ApplicantResponse)
+def restore_applicant(applicant_id: UUID, current_user: dict = Depends(get_current_user)):
+    """Move an archived applicant (and their notes) back to the active set"""
+    supabase = get_supabase()
+    shop_id = current_user.get("shop_id")
+    
+    restored = supabase.rpc("restore_applicant", {
+        "target_id": str(applicant_id),
+        "target_shop_id": shop_id,
+    }).execute()
+    
+    if not restored.data:
+        raise HTTPException(status_code=404, detail="Archived applicant not found")
+    
+    result = supabase.table("applicants").select("*")\
+        .eq("id", str(applicant_id))\
+        .eq("shop_id", shop_id)\
+        .execute()
     
     return result.data[0]
 
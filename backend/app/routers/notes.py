@@ -1,30 +1,67 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from typing import List
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from typing import List, Optional
 from uuid import UUID
 
 from app.supabase_client import get_supabase
 from app.auth import get_current_user
-from app.schemas.note import NoteCreate, NoteResponse
+from app.schemas.note import NoteCreate, NoteResponse, NotePartialResponse, NoteSearchHit, NOTE_FIELDS
+from app.fieldsets import select_columns
 
 router = APIRouter(prefix="/api/applicants/{applicant_id}/notes", tags=["notes"])
+search_router = APIRouter(prefix="/api/notes", tags=["notes"])
 
 
-@router.get("", response_model=List[NoteResponse])
-def list_notes(applicant_id: UUID, current_user: dict = Depends(get_current_user)):
-    """List all notes for an applicant. Requires auth."""
+@search_router.get("/search", response_model=List[NoteSearchHit])
+def search_notes(
+    q: str = Query(..., min_length=1, description="Search terms, e.g. start march"),
+    limit: int = Query(20, ge=1, le=100),
+    offset: int = Query(0, ge=0),
+    current_user: dict = Depends(get_current_user)
+):
+    """Full-text search across all notes in the current user's shop, best matches first."""
     supabase = get_supabase()
+    shop_id = current_user.get("shop_id")
+    
+    if not shop_id:
+        raise HTTPException(status_code=400, detail="User not associated with a shop")
+    
+    result = supabase.rpc("search_notes", {
+        "target_shop_id": shop_id,
+        "search_query": q,
+        "result_limit": limit,
+        "result_offset": offset,
+    }).execute()
     
-    # Verify applicant exists
-    applicant = supabase.table("applicants").select("id").eq("id", str(applicant_id)).execute()
+    return result.data
+
+
+@router.get("", response_model=List[NotePartialResponse], response_model_exclude_unset=True)
+def list_notes(
+    applicant_id: UUID,
+    fields: Optional[str] = Query(None, description="Comma-separated columns to return, e.g. id,message"),
+    include_archived: bool = Query(False),
+    current_user: dict = Depends(get_current_user)
+):
+    """List all notes for an applicant. Requires auth. include_archived=true also finds archived applicants."""
+    supabase = get_supabase()
+    applicants_table = "applicants_all" if include_archived else "applicants"
+    notes_table = "applicant_notes_all" if include_archived else "applicant_notes"
+    
+    # Verify applicant exists in the user's shop
+    applicant = supabase.table(applicants_table).select("id")\
+        .eq("id", str(applicant_id))\
+        .eq("shop_id", current_user.get("shop_id"))\
+        .execute()
     if not applicant.data:
         raise HTTPException(status_code=404, detail="Applicant not found")
     
-    result = supabase.table("applicant_notes")\
-        .select("*")\
+    # Explicit columns keep search_vector out of the payload
+    columns = select_columns(fields, NOTE_FIELDS) if fields else ", ".join(NOTE_FIELDS)
+    result = supabase.table(notes_table)\
+        .select(columns)\
         .eq("applicant_id", str(applicant_id))\
         .order("created_at", desc=True)\
         .execute()
-    
     return result.data
 
 
@@ -37,8 +74,11 @@ def create_note(
     """Add a new note to an applicant. Requires auth."""
     supabase = get_supabase()
     
-    # Verify applicant exists
-    applicant = supabase.table("applicants").select("id").eq("id", str(applicant_id)).execute()
+    # Verify applicant exists in the user's shop
+    applicant = supabase.table("applicants").select("id")\
+        .eq("id", str(applicant_id))\
+        .eq("shop_id", current_user.get("shop_id"))\
+        .execute()
     if not applicant.data:
         raise HTTPException(status_code=404, detail="Applicant not found")
     
@@ -3,14 +3,18 @@ from app.schemas.applicant import (
     ApplicantUpdate,
     ApplicantResponse,
     ApplicantListResponse,
+    ApplicantPartialResponse,
 )
-from app.schemas.note import NoteCreate, NoteResponse
+from app.schemas.note import NoteCreate, NoteResponse, NotePartialResponse, NoteSearchHit
 
 __all__ = [
     "ApplicantCreate",
     "ApplicantUpdate",
     "ApplicantResponse",
     "ApplicantListResponse",
+    "ApplicantPartialResponse",
     "NoteCreate",
     "NoteResponse",
+    "NotePartialResponse",
+    "NoteSearchHit",
 ]
@@ -23,6 +23,13 @@ VALID_SOURCES = [
 ]
 
 
+# Columns the list endpoint can return via fields=
+APPLICANT_LIST_FIELDS = (
+    "id", "created_at", "full_name", "email", "phone", "position_applied",
+    "status", "source", "experience_years", "ase_certs"
+)
+
+
 class ApplicantCreate(BaseModel):
     """Public application submission"""
     shop_id: UUID
@@ -59,6 +66,7 @@ class ApplicantResponse(BaseModel):
     source: Optional[str]
     form_data: Dict[str, Any]
     internal_data: Dict[str, Any]
+    archived: bool = False
 
 
 class ApplicantListResponse(BaseModel):
@@ -70,3 +78,19 @@ class ApplicantListResponse(BaseModel):
     position_applied: str
     status: str
     source: Optional[str]
+    archived: bool = False
+
+
+class ApplicantPartialResponse(BaseModel):
+    """List row for fields=; only the selected columns are returned."""
+    id: UUID
+    created_at: Optional[datetime] = None
+    full_name: Optional[str] = None
+    email: Optional[str] = None
+    phone: Optional[str] = None
+    position_applied: Optional[str] = None
+    status: Optional[str] = None
+    source: Optional[str] = None
+    experience_years: Optional[int] = None
+    ase_certs: Optional[List[str]] = None
+    archived: Optional[bool] = None
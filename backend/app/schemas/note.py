@@ -4,6 +4,10 @@ from datetime import datetime
 from uuid import UUID
 
 
+# Columns the list endpoint can return via fields=
+NOTE_FIELDS = ("id", "applicant_id", "created_at", "added_by", "added_by_id", "message")
+
+
 class NoteCreate(BaseModel):
     """Schema for creating a new note."""
     message: str = Field(..., min_length=1)
@@ -21,3 +25,26 @@ class NoteResponse(BaseModel):
 
     class Config:
         from_attributes = True
+
+
+class NotePartialResponse(BaseModel):
+    """Note for fields=; only the selected columns are returned."""
+    id: UUID
+    applicant_id: Optional[UUID] = None
+    created_at: Optional[datetime] = None
+    added_by: Optional[str] = None
+    added_by_id: Optional[UUID] = None
+    message: Optional[str] = None
+
+
+class NoteSearchHit(BaseModel):
+    """Shop-wide note search result with applicant summary."""
+    id: UUID
+    applicant_id: UUID
+    created_at: datetime
+    added_by: Optional[str]
+    message: str
+    rank: float
+    applicant_full_name: str
+    applicant_position_applied: str
+    applicant_status: str
@@ -0,0 +1,76 @@
+"""
+Validation throughput: compiled Pydantic model vs walking the schema dict.
+
+Run from backend/:
+    python -m benchmarks.form_validation_bench
+"""
+import os
+import timeit
+
+os.environ.setdefault("SUPABASE_URL", "http://localhost")
+os.environ.setdefault("SUPABASE_SERVICE_KEY", "bench")
+os.environ.setdefault("SUPABASE_JWT_SECRET", "bench")
+
+from app.form_schema import get_form_schema, iter_fields  # noqa: E402
+from app.form_validation import get_default_form_model, validate_form_data  # noqa: E402
+
+SHOP = {"id": "bench", "settings": {}}
+
+PAYLOAD = {
+    "years_in_industry": 8,
+    "years_in_role": 5,
+    "previous_shops": "Firestone 2016-2020, independent shop 2020-present",
+    "expected_pay": "$32/hr",
+    "has_tools": "Yes",
+    "ase_certs": ["A1 Engine Repair", "A5 Brakes", "A8 Engine Performance"],
+    "skill_brakes": "Advanced",
+    "skill_engine_performance": "Advanced",
+    "skill_diagnostics": "Intermediate",
+    "skill_electrical": "Intermediate",
+    "equipment_scan_tools": ["Autel", "Snap-On"],
+    "has_valid_license": "Yes",
+    "willing_saturdays": "Occasionally",
+    "desired_shift": "Full-time",
+    "available_start": "2026-03-01",
+}
+
+
+def dict_walk_validate(form_data, schema, role):
+    """Baseline: look up each key in the schema and check it by hand."""
+    fields = {field["key"]: field for field in iter_fields(schema)}
+    cleaned = {}
+    for key, value in form_data.items():
+        field = fields.get(key)
+        if field is None:
+            cleaned[key] = value
+            continue
+        if role not in field.get("editable_by", []):
+            raise ValueError(f"{key} is not editable by {role}")
+        if value is None:
+            cleaned[key] = None
+            continue
+        if field["type"] == "select" and value not in field["options"]:
+            raise ValueError(f"Invalid value for {key}")
+        if field["type"] == "multi_select" and any(v not in field["options"] for v in value):
+            raise ValueError(f"Invalid value for {key}")
+        if field["type"] == "number":
+            value = int(value)
+            if not 0 <= value <= 100:
+                raise ValueError(f"Invalid value for {key}")
+        cleaned[key] = value
+    return cleaned
+
+
+def main(number: int = 20000) -> None:
+    schema = get_form_schema()
+    get_default_form_model("applicant")
+
+    compiled = timeit.timeit(lambda: validate_form_data(PAYLOAD, SHOP, "applicant"), number=number)
+    walked = timeit.timeit(lambda: dict_walk_validate(PAYLOAD, schema, "applicant"), number=number)
+
+    print(f"compiled model: {number / compiled:,.0f} validations/sec")
+    print(f"dict walk:      {number / walked:,.0f} validations/sec")
+
+
+if __name__ == "__main__":
+    main()
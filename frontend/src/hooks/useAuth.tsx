@@ -109,6 +109,8 @@ export function AuthProvider({ children }: { children: ReactNode }) {
 
   const refreshShop = async () => {
     if (user) {
+      // New access token so it carries the shop_id claim
+      await supabase.auth.refreshSession();
       await fetchShop(user.id);
     }
   };
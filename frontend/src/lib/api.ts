@@ -83,11 +83,21 @@ export async function listApplicants(params?: {
   status?: string;
   position?: string;
   search?: string;
+  certs?: string[];
+  min_experience?: number;
+  form_filters?: Record<string, string>;
+  include_archived?: boolean;
+  fields?: string[];
 }): Promise<ApplicantListItem[]> {
   const searchParams = new URLSearchParams();
   if (params?.status) searchParams.set('status', params.status);
   if (params?.position) searchParams.set('position', params.position);
   if (params?.search) searchParams.set('search', params.search);
+  params?.certs?.forEach(cert => searchParams.append('cert', cert));
+  if (params?.min_experience !== undefined) searchParams.set('min_experience', String(params.min_experience));
+  Object.entries(params?.form_filters || {}).forEach(([key, value]) => searchParams.set(key, value));
+  if (params?.include_archived) searchParams.set('include_archived', 'true');
+  if (params?.fields?.length) searchParams.set('fields', params.fields.join(','));
 
   const qs = searchParams.toString();
   const url = API_URL + '/api/applicants' + (qs ? '?' + qs : '');
@@ -100,8 +110,9 @@ export async function listApplicants(params?: {
   return response.json();
 }
 
-export async function getApplicant(id: string): Promise<Applicant> {
-  const response = await fetchWithAuth(API_URL + '/api/applicants/' + id);
+export async function getApplicant(id: string, includeArchived = false): Promise<Applicant> {
+  const qs = includeArchived ? '?include_archived=true' : '';
+  const response = await fetchWithAuth(API_URL + '/api/applicants/' + id + qs);
   if (!response.ok) {
     const error = await response.json();
     throw new Error(error.detail || 'Failed to fetch applicant');
@@ -130,6 +141,15 @@ export async function updateApplicant(id: string, data: {
   return response.json();
 }
 
+export async function restoreApplicant(id: string): Promise<Applicant> {
+  const response = await fetchWithAuth(API_URL + '/api/applicants/' + id + '/restore', { method: 'POST' });
+  if (!response.ok) {
+    const error = await response.json();
+    throw new Error(error.detail || 'Failed to restore applicant');
+  }
+  return response.json();
+}
+
 export async function deleteApplicant(id: string): Promise<void> {
   const response = await fetchWithAuth(API_URL + '/api/applicants/' + id, { method: 'DELETE' });
   if (!response.ok) {
@@ -139,8 +159,9 @@ export async function deleteApplicant(id: string): Promise<void> {
 }
 
 // Notes API
-export async function listNotes(applicantId: string): Promise<any[]> {
-  const response = await fetchWithAuth(API_URL + '/api/applicants/' + applicantId + '/notes');
+export async function listNotes(applicantId: string, includeArchived = false): Promise<any[]> {
+  const qs = includeArchived ? '?include_archived=true' : '';
+  const response = await fetchWithAuth(API_URL + '/api/applicants/' + applicantId + '/notes' + qs);
   if (!response.ok) {
     const error = await response.json();
     throw new Error(error.detail || 'Failed to fetch notes');
@@ -160,6 +181,19 @@ export async function createNote(applicantId: string, data: { message: string })
   return response.json();
 }
 
+export async function searchNotes(q: string, params?: { limit?: number; offset?: number }): Promise<any[]> {
+  const searchParams = new URLSearchParams({ q });
+  if (params?.limit) searchParams.set('limit', String(params.limit));
+  if (params?.offset) searchParams.set('offset', String(params.offset));
+
+  const response = await fetchWithAuth(API_URL + '/api/notes/search?' + searchParams.toString());
+  if (!response.ok) {
+    const error = await response.json();
+    throw new Error(error.detail || 'Failed to search notes');
+  }
+  return response.json();
+}
+
 // Upload API
 export async function uploadResume(file: File): Promise<string> {
   const response = await fetch(API_URL + '/api/upload/resume', {
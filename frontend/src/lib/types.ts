@@ -61,6 +61,7 @@ export interface Applicant {
   source: string | null;
   form_data: Record<string, any>;
   internal_data: Record<string, any>;
+  archived?: boolean;
 }
 
 export interface ApplicantListItem {
@@ -72,4 +73,5 @@ export interface ApplicantListItem {
   position_applied: string;
   status: string;
   source: string | null;
+  archived?: boolean;
 }
@@ -1,7 +1,7 @@
 import { useState } from 'react';
-import { useParams, useNavigate, Link } from 'react-router-dom';
+import { useParams, useNavigate, useSearchParams, Link } from 'react-router-dom';
 import { useQuery, useMutation, useQueryClient } from '@tanstack/react-query';
-import { getApplicant, updateApplicant, deleteApplicant, listNotes, createNote } from '../lib/api';
+import { getApplicant, updateApplicant, deleteApplicant, restoreApplicant, listNotes, createNote } from '../lib/api';
 import { Layout } from '../components/Layout';
 import { StatusBadge } from '../components/StatusBadge';
 import { STATUSES, type Status } from '../lib/types';
@@ -10,17 +10,21 @@ export function ApplicantView() {
   const { id } = useParams<{ id: string }>();
   const navigate = useNavigate();
   const queryClient = useQueryClient();
+  const [searchParams] = useSearchParams();
   const [newNote, setNewNote] = useState('');
 
+  // Archived applicants are only looked up when linked from the archived list
+  const includeArchived = searchParams.get('archived') === '1';
+
   const { data: applicant, isLoading: applicantLoading } = useQuery({
-    queryKey: ['applicant', id],
-    queryFn: () => getApplicant(id!),
+    queryKey: ['applicant', id, includeArchived],
+    queryFn: () => getApplicant(id!, includeArchived),
     enabled: !!id,
   });
 
   const { data: notes = [], isLoading: notesLoading } = useQuery({
-    queryKey: ['notes', id],
-    queryFn: () => listNotes(id!),
+    queryKey: ['notes', id, includeArchived],
+    queryFn: () => listNotes(id!, includeArchived),
     enabled: !!id,
   });
 
@@ -41,6 +45,16 @@ export function ApplicantView() {
     },
   });
 
+  const restoreMutation = useMutation({
+    mutationFn: () => restoreApplicant(id!),
+    onSuccess: () => {
+      queryClient.invalidateQueries({ queryKey: ['applicant', id] });
+      queryClient.invalidateQueries({ queryKey: ['notes', id] });
+      queryClient.invalidateQueries({ queryKey: ['applicants'] });
+      navigate(`/applicants/${id}`, { replace: true });
+    },
+  });
+
   const noteMutation = useMutation({
     mutationFn: (message: string) => createNote(id!, { message }),
     onSuccess: () => {
@@ -61,6 +75,12 @@ export function ApplicantView() {
     }
   };
 
+  const handleRestore = () => {
+    if (confirm('Restore this applicant to the active list?')) {
+      restoreMutation.mutate();
+    }
+  };
+
   const handleAddNote = (e: React.FormEvent) => {
     e.preventDefault();
     if (newNote.trim()) {
@@ -120,15 +140,31 @@ export function ApplicantView() {
               <span className="text-gray-500">{applicant.position_applied}</span>
             </div>
           </div>
-          <button
-            onClick={handleDelete}
-            className="btn btn-danger"
-            disabled={deleteMutation.isPending}
-          >
-            Delete
-          </button>
+          {applicant.archived ? (
+            <button
+              onClick={handleRestore}
+              className="btn btn-primary"
+              disabled={restoreMutation.isPending}
+            >
+              {restoreMutation.isPending ? 'Restoring...' : 'Restore'}
+            </button>
+          ) : (
+            <button
+              onClick={handleDelete}
+              className="btn btn-danger"
+              disabled={deleteMutation.isPending}
+            >
+              Delete
+            </button>
+          )}
         </div>
 
+        {applicant.archived && (
+          <div className="bg-yellow-50 text-yellow-800 rounded-md p-4">
+            This applicant is archived. Restore them to change their status or add notes.
+          </div>
+        )}
+
         <div className="grid grid-cols-1 lg:grid-cols-3 gap-6">
           {/* Main Info */}
           <div className="lg:col-span-2 space-y-6">
@@ -196,11 +232,11 @@ export function ApplicantView() {
                   </div>
                   <div>
                     <p className="text-sm text-gray-500">Valid License</p>
-                    <p className="font-medium">{formData.has_valid_license ? 'Yes' : 'No'}</p>
+                    <p className="font-medium">{formData.has_valid_license || 'Not specified'}</p>
                   </div>
                   <div>
                     <p className="text-sm text-gray-500">Can Work Saturdays</p>
-                    <p className="font-medium">{formData.can_work_saturdays ? 'Yes' : 'No'}</p>
+                    <p className="font-medium">{formData.willing_saturdays || 'Not specified'}</p>
                   </div>
                 </div>
 
@@ -225,22 +261,24 @@ export function ApplicantView() {
               <h2 className="text-lg font-semibold mb-4">Notes & Activity</h2>
 
               {/* Add note form */}
-              <form onSubmit={handleAddNote} className="mb-6">
-                <textarea
-                  value={newNote}
-                  onChange={(e) => setNewNote(e.target.value)}
-                  placeholder="Add a note..."
-                  rows={3}
-                  className="input mb-2"
-                />
-                <button
-                  type="submit"
-                  className="btn btn-primary"
-                  disabled={!newNote.trim() || noteMutation.isPending}
-                >
-                  {noteMutation.isPending ? 'Adding...' : 'Add Note'}
-                </button>
-              </form>
+              {!applicant.archived && (
+                <form onSubmit={handleAddNote} className="mb-6">
+                  <textarea
+                    value={newNote}
+                    onChange={(e) => setNewNote(e.target.value)}
+                    placeholder="Add a note..."
+                    rows={3}
+                    className="input mb-2"
+                  />
+                  <button
+                    type="submit"
+                    className="btn btn-primary"
+                    disabled={!newNote.trim() || noteMutation.isPending}
+                  >
+                    {noteMutation.isPending ? 'Adding...' : 'Add Note'}
+                  </button>
+                </form>
+              )}
 
               {/* Notes list */}
               {notesLoading ? (
@@ -286,25 +324,27 @@ export function ApplicantView() {
             </div>
 
             {/* Status Actions */}
-            <div className="card">
-              <h2 className="text-lg font-semibold mb-4">Update Status</h2>
-              <div className="space-y-2">
-                {getNextStatuses(applicant.status as Status).map(status => (
-                  <button
-                    key={status}
-                    onClick={() => handleStatusChange(status)}
-                    disabled={updateMutation.isPending}
-                    className={'w-full btn ' + (
-                      status === 'HIRED' ? 'btn-success' :
-                      status === 'REJECTED' ? 'btn-danger' :
-                      'btn-secondary'
-                    )}
-                  >
-                    Move to {status.replace('_', ' ')}
-                  </button>
-                ))}
+            {!applicant.archived && (
+              <div className="card">
+                <h2 className="text-lg font-semibold mb-4">Update Status</h2>
+                <div className="space-y-2">
+                  {getNextStatuses(applicant.status as Status).map(status => (
+                    <button
+                      key={status}
+                      onClick={() => handleStatusChange(status)}
+                      disabled={updateMutation.isPending}
+                      className={'w-full btn ' + (
+                        status === 'HIRED' ? 'btn-success' :
+                        status === 'REJECTED' ? 'btn-danger' :
+                        'btn-secondary'
+                      )}
+                    >
+                      Move to {status.replace('_', ' ')}
+                    </button>
+                  ))}
+                </div>
               </div>
-            </div>
+            )}
 
             {/* Application Notes */}
             {formData.notes && (
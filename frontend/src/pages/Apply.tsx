@@ -80,8 +80,8 @@ export function Apply() {
         expected_pay: formData.expected_pay || null,
         available_start: formData.available_start || null,
         has_tools: formData.has_tools || null,
-        has_valid_license: formData.has_valid_license,
-        can_work_saturdays: formData.can_work_saturdays,
+        has_valid_license: formData.has_valid_license ? 'Yes' : 'No',
+        willing_saturdays: formData.can_work_saturdays ? 'Yes' : 'No',
         certifications: formData.certifications,
         notes: formData.notes || null,
         resume_url: resume_url || null,
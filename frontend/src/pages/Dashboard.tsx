@@ -22,13 +22,15 @@ export function Dashboard() {
   const [statusFilter, setStatusFilter] = useState<string>('');
   const [positionFilter, setPositionFilter] = useState<string>('');
   const [searchQuery, setSearchQuery] = useState('');
+  const [showArchived, setShowArchived] = useState(false);
 
   const { data: applicants = [], isLoading, error } = useQuery({
-    queryKey: ['applicants', statusFilter, positionFilter, searchQuery],
+    queryKey: ['applicants', statusFilter, positionFilter, searchQuery, showArchived],
     queryFn: () => listApplicants({
       status: statusFilter || undefined,
       position: positionFilter || undefined,
       search: searchQuery || undefined,
+      include_archived: showArchived,
     }),
   });
 
@@ -36,12 +38,17 @@ export function Dashboard() {
     columnHelper.accessor('full_name', {
       header: 'Name',
       cell: info => (
-        <Link
-          to={`/applicants/${info.row.original.id}`}
-          className="text-blue-600 hover:text-blue-800 font-medium"
-        >
-          {info.getValue()}
-        </Link>
+        <>
+          <Link
+            to={`/applicants/${info.row.original.id}` + (info.row.original.archived ? '?archived=1' : '')}
+            className="text-blue-600 hover:text-blue-800 font-medium"
+          >
+            {info.getValue()}
+          </Link>
+          {info.row.original.archived && (
+            <span className="ml-2 bg-gray-100 text-gray-600 px-2 py-0.5 rounded text-xs">Archived</span>
+          )}
+        </>
       ),
     }),
     columnHelper.accessor('position_applied', {
@@ -116,6 +123,14 @@ export function Dashboard() {
               ))}
             </select>
           </div>
+          <label className="flex items-center gap-2 text-sm text-gray-700">
+            <input
+              type="checkbox"
+              checked={showArchived}
+              onChange={(e) => setShowArchived(e.target.checked)}
+            />
+            Show archived
+          </label>
         </div>
 
         {/* Table */}
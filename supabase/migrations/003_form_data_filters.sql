@@ -0,0 +1,43 @@
+-- AutoShopATS form_data Filters
+-- Indexes backing the schema-driven filters on GET /api/applicants
+
+-- =====================
+-- HELPERS
+-- =====================
+-- jsonb array -> text[] (empty for anything that is not an array)
+CREATE OR REPLACE FUNCTION jsonb_text_array(j JSONB)
+RETURNS TEXT[] AS $$
+  SELECT CASE
+    WHEN jsonb_typeof(j) = 'array' THEN ARRAY(SELECT jsonb_array_elements_text(j))
+    ELSE '{}'::text[]
+  END;
+$$ LANGUAGE sql IMMUTABLE;
+
+-- =====================
+-- GENERATED COLUMNS (hot keys)
+-- =====================
+-- years_in_industry is the schema key; experience_years is what the apply form sends
+ALTER TABLE applicants ADD COLUMN IF NOT EXISTS experience_years INTEGER
+  GENERATED ALWAYS AS (
+    CASE
+      WHEN jsonb_typeof(form_data->'years_in_industry') = 'number'
+        THEN (form_data->>'years_in_industry')::numeric::integer
+      WHEN jsonb_typeof(form_data->'experience_years') = 'number'
+        THEN (form_data->>'experience_years')::numeric::integer
+    END
+  ) STORED;
+
+-- ase_certs is the schema key; certifications is what the apply form sends
+ALTER TABLE applicants ADD COLUMN IF NOT EXISTS ase_certs TEXT[]
+  GENERATED ALWAYS AS (
+    jsonb_text_array(COALESCE(form_data->'ase_certs', form_data->'certifications'))
+  ) STORED;
+
+-- =====================
+-- INDEXES
+-- =====================
+CREATE INDEX IF NOT EXISTS idx_applicants_shop_experience ON applicants(shop_id, experience_years);
+CREATE INDEX IF NOT EXISTS idx_applicants_ase_certs ON applicants USING GIN (ase_certs);
+
+-- Skills, availability and other select fields: form_data @> '{"key": "value"}'
+CREATE INDEX IF NOT EXISTS idx_applicants_form_data ON applicants USING GIN (form_data jsonb_path_ops);
@@ -0,0 +1,108 @@
+-- AutoShopATS Transactional Outbox
+-- Side effects (system notes, notifications) are recorded as events in the
+-- same transaction as the applicant change and drained by the API's worker
+
+-- =====================
+-- OUTBOX TABLE
+-- =====================
+CREATE TABLE IF NOT EXISTS outbox_events (
+  id UUID DEFAULT gen_random_uuid() PRIMARY KEY,
+  created_at TIMESTAMPTZ DEFAULT now(),
+  event_type TEXT NOT NULL,
+  payload JSONB NOT NULL DEFAULT '{}'::jsonb,
+
+  -- Delivery state
+  attempts INTEGER NOT NULL DEFAULT 0,
+  available_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+  locked_until TIMESTAMPTZ,
+  processed_at TIMESTAMPTZ,
+  failed_at TIMESTAMPTZ,
+  last_error TEXT
+);
+
+-- Only pending events are scanned by the worker
+CREATE INDEX IF NOT EXISTS idx_outbox_pending ON outbox_events(available_at)
+  WHERE processed_at IS NULL AND failed_at IS NULL;
+
+-- Service role only
+ALTER TABLE outbox_events ENABLE ROW LEVEL SECURITY;
+
+-- =====================
+-- WHO CHANGED THE STATUS (read by the status trigger)
+-- =====================
+ALTER TABLE applicants ADD COLUMN IF NOT EXISTS status_changed_by TEXT;
+ALTER TABLE applicants ADD COLUMN IF NOT EXISTS status_changed_by_id UUID;
+
+-- =====================
+-- IDEMPOTENT NOTES (a retried event must not add a second note)
+-- =====================
+ALTER TABLE applicant_notes ADD COLUMN IF NOT EXISTS source_event_id UUID UNIQUE;
+
+-- =====================
+-- EVENT TRIGGERS
+-- =====================
+CREATE OR REPLACE FUNCTION outbox_applicant_created()
+RETURNS TRIGGER AS $$
+BEGIN
+  INSERT INTO outbox_events (event_type, payload)
+  VALUES ('applicant.created', jsonb_build_object(
+    'applicant_id', NEW.id,
+    'shop_id', NEW.shop_id,
+    'source', NEW.source
+  ));
+  RETURN NEW;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER;
+
+CREATE OR REPLACE FUNCTION outbox_applicant_status_changed()
+RETURNS TRIGGER AS $$
+BEGIN
+  INSERT INTO outbox_events (event_type, payload)
+  VALUES ('applicant.status_changed', jsonb_build_object(
+    'applicant_id', NEW.id,
+    'shop_id', NEW.shop_id,
+    'old_status', OLD.status,
+    'new_status', NEW.status,
+    'changed_by', NEW.status_changed_by,
+    'changed_by_id', NEW.status_changed_by_id
+  ));
+  RETURN NEW;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER;
+
+DROP TRIGGER IF EXISTS applicants_outbox_created ON applicants;
+CREATE TRIGGER applicants_outbox_created
+  AFTER INSERT ON applicants
+  FOR EACH ROW EXECUTE FUNCTION outbox_applicant_created();
+
+DROP TRIGGER IF EXISTS applicants_outbox_status ON applicants;
+CREATE TRIGGER applicants_outbox_status
+  AFTER UPDATE OF status ON applicants
+  FOR EACH ROW
+  WHEN (OLD.status IS DISTINCT FROM NEW.status)
+  EXECUTE FUNCTION outbox_applicant_status_changed();
+
+-- =====================
+-- CLAIMING A BATCH
+-- =====================
+-- Leases up to batch_size due events; SKIP LOCKED lets several API
+-- instances drain the outbox without handing out the same event twice
+CREATE OR REPLACE FUNCTION claim_outbox_events(batch_size INTEGER, lease_seconds INTEGER DEFAULT 60)
+RETURNS SETOF outbox_events AS $$
+  UPDATE outbox_events
+  SET locked_until = now() + make_interval(secs => lease_seconds),
+      attempts = attempts + 1
+  WHERE id IN (
+    SELECT id FROM outbox_events
+    WHERE processed_at IS NULL
+      AND failed_at IS NULL
+      AND available_at <= now()
+      AND (locked_until IS NULL OR locked_until < now())
+    ORDER BY available_at
+    LIMIT batch_size
+    FOR UPDATE SKIP LOCKED
+  )
+  RETURNING *;
+$$ LANGUAGE sql;
+
+REVOKE EXECUTE ON FUNCTION claim_outbox_events(INTEGER, INTEGER) FROM PUBLIC, anon, authenticated;
@@ -0,0 +1,161 @@
+-- AutoShopATS Applicant Archive
+-- HIRED/REJECTED applicants older than the shop's threshold are moved out of
+-- applicants (with their notes) so the active set stays small
+
+-- =====================
+-- ARCHIVE TABLES
+-- =====================
+-- LIKE without INCLUDING GENERATED keeps experience_years/ase_certs as plain columns
+CREATE TABLE IF NOT EXISTS applicants_archive (LIKE applicants INCLUDING DEFAULTS, PRIMARY KEY (id));
+ALTER TABLE applicants_archive ADD COLUMN IF NOT EXISTS archived_at TIMESTAMPTZ DEFAULT now();
+
+CREATE INDEX IF NOT EXISTS idx_applicants_archive_shop ON applicants_archive(shop_id, created_at DESC);
+
+CREATE TABLE IF NOT EXISTS applicant_notes_archive (LIKE applicant_notes INCLUDING DEFAULTS, PRIMARY KEY (id));
+
+CREATE INDEX IF NOT EXISTS idx_notes_archive_applicant ON applicant_notes_archive(applicant_id);
+
+ALTER TABLE applicants_archive ENABLE ROW LEVEL SECURITY;
+ALTER TABLE applicant_notes_archive ENABLE ROW LEVEL SECURITY;
+
+DROP POLICY IF EXISTS "Shop users can view archived applicants" ON applicants_archive;
+CREATE POLICY "Shop users can view archived applicants" ON applicants_archive
+  FOR SELECT USING (
+    shop_id IN (SELECT shop_id FROM profiles WHERE id = auth.uid())
+  );
+
+DROP POLICY IF EXISTS "Shop users can view archived notes" ON applicant_notes_archive;
+CREATE POLICY "Shop users can view archived notes" ON applicant_notes_archive
+  FOR SELECT USING (
+    applicant_id IN (
+      SELECT a.id FROM applicants_archive a
+      JOIN profiles p ON a.shop_id = p.shop_id
+      WHERE p.id = auth.uid()
+    )
+  );
+
+-- Terminal applicants waiting for archival
+CREATE INDEX IF NOT EXISTS idx_applicants_terminal ON applicants(updated_at)
+  WHERE status IN ('HIRED', 'REJECTED');
+
+-- =====================
+-- ACTIVE + ARCHIVED VIEW (include_archived=true)
+-- =====================
+CREATE OR REPLACE VIEW applicants_all WITH (security_invoker = true) AS
+  SELECT id, created_at, updated_at, shop_id, full_name, email, phone, position_applied,
+         status, source, form_data, internal_data, experience_years, ase_certs,
+         false AS archived
+  FROM applicants
+  UNION ALL
+  SELECT id, created_at, updated_at, shop_id, full_name, email, phone, position_applied,
+         status, source, form_data, internal_data, experience_years, ase_certs,
+         true AS archived
+  FROM applicants_archive;
+
+-- =====================
+-- RESTORES DON'T RE-EMIT applicant.created
+-- =====================
+CREATE OR REPLACE FUNCTION outbox_applicant_created()
+RETURNS TRIGGER AS $$
+BEGIN
+  IF current_setting('app.restoring', true) = 'on' THEN
+    RETURN NEW;
+  END IF;
+
+  INSERT INTO outbox_events (event_type, payload)
+  VALUES ('applicant.created', jsonb_build_object(
+    'applicant_id', NEW.id,
+    'shop_id', NEW.shop_id,
+    'source', NEW.source
+  ));
+  RETURN NEW;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER;
+
+-- =====================
+-- ARCHIVE A BATCH
+-- =====================
+-- Threshold per shop: shops.settings->>'archive_after_days' (default_days otherwise)
+CREATE OR REPLACE FUNCTION archive_applicants(batch_size INTEGER, default_days INTEGER DEFAULT 90)
+RETURNS INTEGER AS $$
+DECLARE
+  ids UUID[];
+BEGIN
+  SELECT array_agg(c.id) INTO ids FROM (
+    SELECT a.id
+    FROM applicants a
+    JOIN shops s ON s.id = a.shop_id
+    WHERE a.status IN ('HIRED', 'REJECTED')
+      AND a.updated_at < now() - make_interval(
+        days => COALESCE((s.settings->>'archive_after_days')::integer, default_days)
+      )
+    ORDER BY a.updated_at
+    LIMIT batch_size
+    FOR UPDATE OF a SKIP LOCKED
+  ) c;
+
+  IF ids IS NULL THEN
+    RETURN 0;
+  END IF;
+
+  INSERT INTO applicants_archive (
+    id, created_at, updated_at, shop_id, full_name, email, phone, position_applied,
+    status, source, form_data, internal_data, experience_years, ase_certs,
+    status_changed_by, status_changed_by_id
+  )
+  SELECT id, created_at, updated_at, shop_id, full_name, email, phone, position_applied,
+         status, source, form_data, internal_data, experience_years, ase_certs,
+         status_changed_by, status_changed_by_id
+  FROM applicants WHERE id = ANY(ids);
+
+  INSERT INTO applicant_notes_archive (id, applicant_id, created_at, added_by, added_by_id, message, source_event_id)
+  SELECT id, applicant_id, created_at, added_by, added_by_id, message, source_event_id
+  FROM applicant_notes WHERE applicant_id = ANY(ids);
+
+  -- Notes go with the cascade
+  DELETE FROM applicants WHERE id = ANY(ids);
+
+  RETURN array_length(ids, 1);
+END;
+$$ LANGUAGE plpgsql;
+
+-- =====================
+-- RESTORE ONE APPLICANT
+-- =====================
+CREATE OR REPLACE FUNCTION restore_applicant(target_id UUID, target_shop_id UUID)
+RETURNS BOOLEAN AS $$
+BEGIN
+  PERFORM 1 FROM applicants_archive
+  WHERE id = target_id AND shop_id = target_shop_id
+  FOR UPDATE;
+
+  IF NOT FOUND THEN
+    RETURN false;
+  END IF;
+
+  PERFORM set_config('app.restoring', 'on', true);
+
+  INSERT INTO applicants (
+    id, created_at, updated_at, shop_id, full_name, email, phone, position_applied,
+    status, source, form_data, internal_data, status_changed_by, status_changed_by_id
+  )
+  -- updated_at restarts the archival clock so it isn't archived again on the next run
+  SELECT id, created_at, now(), shop_id, full_name, email, phone, position_applied,
+         status, source, form_data, internal_data, status_changed_by, status_changed_by_id
+  FROM applicants_archive WHERE id = target_id;
+
+  INSERT INTO applicant_notes (id, applicant_id, created_at, added_by, added_by_id, message, source_event_id)
+  SELECT id, applicant_id, created_at, added_by, added_by_id, message, source_event_id
+  FROM applicant_notes_archive WHERE applicant_id = target_id;
+
+  DELETE FROM applicant_notes_archive WHERE applicant_id = target_id;
+  DELETE FROM applicants_archive WHERE id = target_id;
+
+  PERFORM set_config('app.restoring', 'off', true);
+
+  RETURN true;
+END;
+$$ LANGUAGE plpgsql;
+
+REVOKE EXECUTE ON FUNCTION archive_applicants(INTEGER, INTEGER) FROM PUBLIC, anon, authenticated;
+REVOKE EXECUTE ON FUNCTION restore_applicant(UUID, UUID) FROM PUBLIC, anon, authenticated;
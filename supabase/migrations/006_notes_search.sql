@@ -0,0 +1,46 @@
+-- AutoShopATS Notes Search
+-- Full-text search across all of a shop's applicant notes (GET /api/notes/search)
+
+-- =====================
+-- SEARCH VECTOR
+-- =====================
+ALTER TABLE applicant_notes ADD COLUMN IF NOT EXISTS search_vector TSVECTOR
+  GENERATED ALWAYS AS (to_tsvector('english', message)) STORED;
+
+CREATE INDEX IF NOT EXISTS idx_notes_search ON applicant_notes USING GIN (search_vector);
+
+-- =====================
+-- SEARCH FUNCTION
+-- =====================
+-- Ranked, paginated hits with the applicant summary, scoped by applicants.shop_id
+CREATE OR REPLACE FUNCTION search_notes(
+  target_shop_id UUID,
+  search_query TEXT,
+  result_limit INTEGER DEFAULT 20,
+  result_offset INTEGER DEFAULT 0
+)
+RETURNS TABLE (
+  id UUID,
+  applicant_id UUID,
+  created_at TIMESTAMPTZ,
+  added_by TEXT,
+  message TEXT,
+  rank REAL,
+  applicant_full_name TEXT,
+  applicant_position_applied TEXT,
+  applicant_status TEXT
+) AS $$
+  SELECT n.id, n.applicant_id, n.created_at, n.added_by, n.message,
+         ts_rank(n.search_vector, q) AS rank,
+         a.full_name, a.position_applied, a.status
+  FROM applicant_notes n
+  JOIN applicants a ON a.id = n.applicant_id
+  CROSS JOIN websearch_to_tsquery('english', search_query) q
+  WHERE a.shop_id = target_shop_id
+    AND n.search_vector @@ q
+  ORDER BY rank DESC, n.created_at DESC
+  LIMIT result_limit
+  OFFSET result_offset;
+$$ LANGUAGE sql STABLE;
+
+REVOKE EXECUTE ON FUNCTION search_notes(UUID, TEXT, INTEGER, INTEGER) FROM PUBLIC, anon, authenticated;
@@ -0,0 +1,101 @@
+-- AutoShopATS shop_id JWT Claim
+-- Embeds the user's shop_id in their access token and rewrites the RLS
+-- policies to read it from the claims instead of joining profiles per row.
+--
+-- Enable the hook in the dashboard: Authentication > Hooks >
+-- Custom Access Token > public.custom_access_token_hook
+
+-- =====================
+-- CUSTOM ACCESS TOKEN HOOK
+-- =====================
+CREATE OR REPLACE FUNCTION public.custom_access_token_hook(event JSONB)
+RETURNS JSONB AS $$
+DECLARE
+  claims JSONB;
+  profile RECORD;
+BEGIN
+  claims := event->'claims';
+
+  SELECT shop_id, full_name INTO profile
+  FROM public.profiles
+  WHERE id = (event->>'user_id')::uuid;
+
+  IF profile.shop_id IS NOT NULL THEN
+    claims := jsonb_set(claims, '{shop_id}', to_jsonb(profile.shop_id));
+  END IF;
+  IF profile.full_name IS NOT NULL THEN
+    claims := jsonb_set(claims, '{full_name}', to_jsonb(profile.full_name));
+  END IF;
+
+  RETURN jsonb_set(event, '{claims}', claims);
+END;
+$$ LANGUAGE plpgsql STABLE;
+
+GRANT USAGE ON SCHEMA public TO supabase_auth_admin;
+GRANT EXECUTE ON FUNCTION public.custom_access_token_hook(JSONB) TO supabase_auth_admin;
+REVOKE EXECUTE ON FUNCTION public.custom_access_token_hook(JSONB) FROM PUBLIC, anon, authenticated;
+
+GRANT SELECT ON TABLE public.profiles TO supabase_auth_admin;
+
+DROP POLICY IF EXISTS "Auth admin can read profiles for token hook" ON profiles;
+CREATE POLICY "Auth admin can read profiles for token hook" ON profiles
+  AS PERMISSIVE FOR SELECT TO supabase_auth_admin
+  USING (true);
+
+-- =====================
+-- CLAIM READER
+-- =====================
+-- STABLE, and wrapped as (SELECT current_shop_id()) in policies, so Postgres
+-- evaluates it once per query (initplan) rather than once per row.
+-- Tokens issued before the hook was enabled (or with it disabled) have no
+-- shop_id claim; those fall back to the profile lookup the old policies did.
+CREATE OR REPLACE FUNCTION public.current_shop_id()
+RETURNS UUID AS $$
+  SELECT COALESCE(
+    NULLIF(current_setting('request.jwt.claims', true)::jsonb->>'shop_id', '')::uuid,
+    (SELECT shop_id FROM public.profiles WHERE id = auth.uid())
+  );
+$$ LANGUAGE sql STABLE;
+
+-- =====================
+-- ROW LEVEL SECURITY (rewritten)
+-- =====================
+DROP POLICY IF EXISTS "Users can view own shop" ON shops;
+CREATE POLICY "Users can view own shop" ON shops
+  FOR SELECT USING (id = (SELECT current_shop_id()));
+
+DROP POLICY IF EXISTS "Users can update own shop" ON shops;
+CREATE POLICY "Users can update own shop" ON shops
+  FOR UPDATE USING (id = (SELECT current_shop_id()));
+
+DROP POLICY IF EXISTS "Shop users can view applicants" ON applicants;
+CREATE POLICY "Shop users can view applicants" ON applicants
+  FOR SELECT USING (shop_id = (SELECT current_shop_id()));
+
+DROP POLICY IF EXISTS "Shop users can update applicants" ON applicants;
+CREATE POLICY "Shop users can update applicants" ON applicants
+  FOR UPDATE USING (shop_id = (SELECT current_shop_id()));
+
+DROP POLICY IF EXISTS "Shop users can delete applicants" ON applicants;
+CREATE POLICY "Shop users can delete applicants" ON applicants
+  FOR DELETE USING (shop_id = (SELECT current_shop_id()));
+
+DROP POLICY IF EXISTS "Shop users can manage notes" ON applicant_notes;
+CREATE POLICY "Shop users can manage notes" ON applicant_notes
+  FOR ALL USING (
+    applicant_id IN (
+      SELECT id FROM applicants WHERE shop_id = (SELECT current_shop_id())
+    )
+  );
+
+DROP POLICY IF EXISTS "Shop users can view archived applicants" ON applicants_archive;
+CREATE POLICY "Shop users can view archived applicants" ON applicants_archive
+  FOR SELECT USING (shop_id = (SELECT current_shop_id()));
+
+DROP POLICY IF EXISTS "Shop users can view archived notes" ON applicant_notes_archive;
+CREATE POLICY "Shop users can view archived notes" ON applicant_notes_archive
+  FOR SELECT USING (
+    applicant_id IN (
+      SELECT id FROM applicants_archive WHERE shop_id = (SELECT current_shop_id())
+    )
+  );
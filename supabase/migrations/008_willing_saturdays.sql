@@ -0,0 +1,26 @@
+-- AutoShopATS willing_saturdays Backfill
+-- The apply form used to store can_work_saturdays (boolean); the schema key
+-- filtered on by GET /api/applicants is willing_saturdays ('Yes'/'No')
+
+-- Rewrite without restarting the archival clock (updated_at)
+ALTER TABLE applicants DISABLE TRIGGER applicants_updated_at;
+
+UPDATE applicants
+SET form_data = (form_data - 'can_work_saturdays') || jsonb_build_object(
+  'willing_saturdays',
+  CASE WHEN form_data->'can_work_saturdays' = 'true'::jsonb THEN 'Yes' ELSE 'No' END
+)
+WHERE form_data ? 'can_work_saturdays'
+  AND jsonb_typeof(form_data->'can_work_saturdays') = 'boolean'
+  AND NOT form_data ? 'willing_saturdays';
+
+ALTER TABLE applicants ENABLE TRIGGER applicants_updated_at;
+
+UPDATE applicants_archive
+SET form_data = (form_data - 'can_work_saturdays') || jsonb_build_object(
+  'willing_saturdays',
+  CASE WHEN form_data->'can_work_saturdays' = 'true'::jsonb THEN 'Yes' ELSE 'No' END
+)
+WHERE form_data ? 'can_work_saturdays'
+  AND jsonb_typeof(form_data->'can_work_saturdays') = 'boolean'
+  AND NOT form_data ? 'willing_saturdays';
@@ -0,0 +1,22 @@
+-- AutoShopATS has_valid_license Backfill
+-- The apply form used to store has_valid_license as a boolean; the form
+-- schema (and form_data filters) expect 'Yes'/'No'
+
+-- Rewrite without restarting the archival clock (updated_at)
+ALTER TABLE applicants DISABLE TRIGGER applicants_updated_at;
+
+UPDATE applicants
+SET form_data = jsonb_set(
+  form_data, '{has_valid_license}',
+  to_jsonb(CASE WHEN form_data->'has_valid_license' = 'true'::jsonb THEN 'Yes' ELSE 'No' END)
+)
+WHERE jsonb_typeof(form_data->'has_valid_license') = 'boolean';
+
+ALTER TABLE applicants ENABLE TRIGGER applicants_updated_at;
+
+UPDATE applicants_archive
+SET form_data = jsonb_set(
+  form_data, '{has_valid_license}',
+  to_jsonb(CASE WHEN form_data->'has_valid_license' = 'true'::jsonb THEN 'Yes' ELSE 'No' END)
+)
+WHERE jsonb_typeof(form_data->'has_valid_license') = 'boolean';
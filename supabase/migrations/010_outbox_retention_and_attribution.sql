@@ -0,0 +1,56 @@
+-- AutoShopATS Outbox Retention & Status Attribution
+
+-- =====================
+-- RETENTION
+-- =====================
+-- The API worker deletes processed events older than outbox_retention_days
+CREATE INDEX IF NOT EXISTS idx_outbox_processed ON outbox_events(processed_at)
+  WHERE processed_at IS NOT NULL;
+
+-- =====================
+-- STATUS ATTRIBUTION
+-- =====================
+-- status_changed_by/_id only describe the statement that sets them: the event
+-- is written BEFORE UPDATE and the columns are cleared on every update, so a
+-- later change through another path is never credited to the previous actor.
+-- Without them, the actor comes from the caller's JWT (RLS updates).
+CREATE OR REPLACE FUNCTION outbox_applicant_status_changed()
+RETURNS TRIGGER AS $$
+DECLARE
+  claims JSONB;
+BEGIN
+  IF OLD.status IS DISTINCT FROM NEW.status THEN
+    claims := NULLIF(current_setting('request.jwt.claims', true), '')::jsonb;
+
+    INSERT INTO outbox_events (event_type, payload)
+    VALUES ('applicant.status_changed', jsonb_build_object(
+      'applicant_id', NEW.id,
+      'shop_id', NEW.shop_id,
+      'old_status', OLD.status,
+      'new_status', NEW.status,
+      'changed_by', COALESCE(NEW.status_changed_by, claims->>'email'),
+      'changed_by_id', COALESCE(NEW.status_changed_by_id::text, claims->>'sub')
+    ));
+  END IF;
+
+  NEW.status_changed_by := NULL;
+  NEW.status_changed_by_id := NULL;
+  RETURN NEW;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER;
+
+DROP TRIGGER IF EXISTS applicants_outbox_status ON applicants;
+CREATE TRIGGER applicants_outbox_status
+  BEFORE UPDATE ON applicants
+  FOR EACH ROW EXECUTE FUNCTION outbox_applicant_status_changed();
+
+-- Clear stale attribution without restarting the archival clock (updated_at)
+ALTER TABLE applicants DISABLE TRIGGER applicants_updated_at;
+
+UPDATE applicants SET status_changed_by = NULL, status_changed_by_id = NULL
+WHERE status_changed_by IS NOT NULL OR status_changed_by_id IS NOT NULL;
+
+ALTER TABLE applicants ENABLE TRIGGER applicants_updated_at;
+
+UPDATE applicants_archive SET status_changed_by = NULL, status_changed_by_id = NULL
+WHERE status_changed_by IS NOT NULL OR status_changed_by_id IS NOT NULL;
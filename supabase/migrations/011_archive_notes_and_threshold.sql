@@ -0,0 +1,64 @@
+-- AutoShopATS Archive Fixes
+-- Archived notes readable through the API, and a malformed per-shop
+-- archive_after_days no longer aborts archival for every shop
+
+-- =====================
+-- ACTIVE + ARCHIVED NOTES VIEW (include_archived=true)
+-- =====================
+CREATE OR REPLACE VIEW applicant_notes_all WITH (security_invoker = true) AS
+  SELECT id, applicant_id, created_at, added_by, added_by_id, message
+  FROM applicant_notes
+  UNION ALL
+  SELECT id, applicant_id, created_at, added_by, added_by_id, message
+  FROM applicant_notes_archive;
+
+-- =====================
+-- ARCHIVE A BATCH (defensive threshold)
+-- =====================
+-- archive_after_days that isn't a plain whole number falls back to default_days
+CREATE OR REPLACE FUNCTION archive_applicants(batch_size INTEGER, default_days INTEGER DEFAULT 90)
+RETURNS INTEGER AS $$
+DECLARE
+  ids UUID[];
+BEGIN
+  SELECT array_agg(c.id) INTO ids FROM (
+    SELECT a.id
+    FROM applicants a
+    JOIN shops s ON s.id = a.shop_id
+    WHERE a.status IN ('HIRED', 'REJECTED')
+      AND a.updated_at < now() - make_interval(
+        days => CASE
+          WHEN s.settings->>'archive_after_days' ~ '^\d{1,5}$'
+            THEN (s.settings->>'archive_after_days')::integer
+          ELSE default_days
+        END
+      )
+    ORDER BY a.updated_at
+    LIMIT batch_size
+    FOR UPDATE OF a SKIP LOCKED
+  ) c;
+
+  IF ids IS NULL THEN
+    RETURN 0;
+  END IF;
+
+  INSERT INTO applicants_archive (
+    id, created_at, updated_at, shop_id, full_name, email, phone, position_applied,
+    status, source, form_data, internal_data, experience_years, ase_certs,
+    status_changed_by, status_changed_by_id
+  )
+  SELECT id, created_at, updated_at, shop_id, full_name, email, phone, position_applied,
+         status, source, form_data, internal_data, experience_years, ase_certs,
+         status_changed_by, status_changed_by_id
+  FROM applicants WHERE id = ANY(ids);
+
+  INSERT INTO applicant_notes_archive (id, applicant_id, created_at, added_by, added_by_id, message, source_event_id)
+  SELECT id, applicant_id, created_at, added_by, added_by_id, message, source_event_id
+  FROM applicant_notes WHERE applicant_id = ANY(ids);
+
+  -- Notes go with the cascade
+  DELETE FROM applicants WHERE id = ANY(ids);
+
+  RETURN array_length(ids, 1);
+END;
+$$ LANGUAGE plpgsql;